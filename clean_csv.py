@@ -1,81 +1,90 @@
+import os
+import re
 import pandas as pd
+import numpy as np
+
+NA_symbol = "N/A"
+# Text columns are read as strings, remaining (day) columns are numeric
+TEXT_COLUMNS = ['Sekcija', 'ImePrezime', 'DatumRođenja']
+# Placeholder values that are left as-is by date normalization
+DATE_PLACEHOLDERS = frozenset((NA_symbol, '0', ''))
+# Precompiled pattern for date normalization: ASCII digits split by a single separator (., /, -),
+# repeated, leading and trailing separators are ignored like the empty parts of a split
+DATE_RE = re.compile(r'^(?=(?:[./-]\s*)*\d+\s*(?P<sep>[./-]))(?:(?P=sep)\s*)*'
+                     r'(?P<day>\d+)(?:\s*(?P=sep))+\s*(?P<month>\d+)(?:\s*(?P=sep))+\s*(?P<year>\d+)'
+                     r'(?:\s*(?P=sep))*$', re.ASCII)
 
 # load csv file 
 filename = 'jesen.csv'
-df = pd.read_csv('data/' + filename)
+input_path = os.path.join('data', filename)
+output_path = os.path.join('data', 'cleaned_' + filename)
+df = pd.read_csv(input_path,
+                 engine='pyarrow',
+                 dtype={col: 'string[pyarrow]' for col in TEXT_COLUMNS},
+                 na_values=['', NA_symbol])
 
-NA_symbol = "N/A"
-
-# Strip whitespaces from every cell in the dataframe
-df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
-# Remove empty rows
-df = df.dropna(how='all')
-# Remove empty columns
-df = df.dropna(axis=1, how='all')
-# replace empty Sekcija, ImePrezime, or DatumRođenja with NaN
-df['Sekcija'] = df['Sekcija'].replace('', NA_symbol)
-df['ImePrezime'] = df['ImePrezime'].replace('', NA_symbol)
-df['DatumRođenja'] = df['DatumRođenja'].replace('', NA_symbol)
-df['Sekcija'] = df['Sekcija'].fillna(NA_symbol)
-df['ImePrezime'] = df['ImePrezime'].fillna(NA_symbol)
-df['DatumRođenja'] = df['DatumRođenja'].fillna(NA_symbol)
+# Strip whitespaces from every text cell in the dataframe (only text columns hold strings)
+for col in TEXT_COLUMNS:
+    df[col] = df[col].str.strip()
+# Remove empty rows and unnamed columns left over from trailing commas (copy only if needed)
+empty_rows = df.isna().all(axis=1)
+if empty_rows.any():
+    df = df.loc[~empty_rows]
+unnamed_columns = df.columns == ''
+if unnamed_columns.any():
+    df = df.loc[:, ~unnamed_columns]
+# replace empty or missing Sekcija, ImePrezime, or DatumRođenja with NA_symbol
+for col in TEXT_COLUMNS:
+    values = df[col]
+    df[col] = values.where(values.notna() & (values != ''), NA_symbol)
 
 # replace NaN with 0 only in numeric columns (not in Sekcija, ImePrezime, DatumRođenja)
+# and convert them to 32-bit integers to avoid decimal points, working on one 2-D array
 numeric_columns = df.select_dtypes(include=['number']).columns
-df[numeric_columns] = df[numeric_columns].fillna(0)
-# Convert numeric columns to integers to avoid decimal points
-df[numeric_columns] = df[numeric_columns].astype(int)
-# Make first letter uppercase only for Sekcija (keep rest unchanged)
-df['Sekcija'] = df['Sekcija'].apply(lambda x: x[0].upper() + x[1:] if isinstance(x, str) and len(x) > 0 and x != '0' else x)
-# Make first letter uppercase only for ImePrezime (keep rest unchanged)
-df['ImePrezime'] = df['ImePrezime'].apply(lambda x: x[0].upper() + x[1:] if isinstance(x, str) and len(x) > 0 and x != '0' else x)
+df[numeric_columns] = df[numeric_columns].to_numpy(dtype=np.float64, na_value=0).astype(np.int32)
+# Make first letter uppercase (keep rest unchanged), skipping empty and '0' values
+def capitalize_first(s):
+    mask = s.notna() & (s != '0') & (s.str.len() > 0)
+    out = s.copy()
+    out.loc[mask] = s.loc[mask].str[0].str.upper() + s.loc[mask].str[1:]
+    return out
+
+df['Sekcija'] = capitalize_first(df['Sekcija'])
+df['ImePrezime'] = capitalize_first(df['ImePrezime'])
 
 # Normalize DatumRođenja to dd.mm.yyyy format
-def normalize_date(date_str):
-    if not isinstance(date_str, str) or date_str in [NA_symbol, '0', '']:
-        return date_str
-    
-    # Remove any extra spaces and trailing dots
-    date_str = date_str.strip().rstrip('.')
-    
-    # Replace multiple spaces with single space, then remove all spaces around dots
-    import re
-    date_str = re.sub(r'\s+', ' ', date_str)  # Replace multiple spaces with single space
-    date_str = re.sub(r'\s*\.\s*', '.', date_str)  # Remove spaces around dots
-    
-    # Handle different separators (., /, -)
-    for sep in ['.', '/', '-']:
-        if sep in date_str:
-            parts = date_str.split(sep)
-            # Filter out empty parts that might result from trailing separators
-            parts = [part.strip() for part in parts if part.strip()]
-            if len(parts) == 3:
-                day, month, year = parts
-                # Ensure day and month are 2 digits, year is 4 digits
-                try:
-                    day = str(int(day)).zfill(2)
-                    month = str(int(month)).zfill(2)
-                    year = str(int(year))
-                    # Handle 2-digit years (assume 1900s or 2000s)
-                    if len(year) == 2:
-                        year_int = int(year)
-                        if year_int > 50:  # assume 1950-1999
-                            year = f"19{year}"
-                        else:  # assume 2000-2049
-                            year = f"20{year}"
-                    elif len(year) == 4:
-                        pass  # year is already 4 digits
-                    else:
-                        return date_str  # invalid year format
-                    
-                    return f"{day}.{month}.{year}"
-                except ValueError:
-                    return date_str  # invalid date components
-            break
-    
-    return date_str  # return original if no separator found
+def normalize_dates(s):
+    # Missing values and placeholders are returned unchanged without any string work
+    todo = s.notna() & ~s.isin(DATE_PLACEHOLDERS)
+
+    # Remove any extra spaces and trailing dots, replace multiple spaces with single space,
+    # then remove all spaces around dots
+    cleaned = (s[todo].str.strip().str.rstrip('.')
+                .str.split().str.join(' ')
+                .str.replace(' .', '.', regex=False)
+                .str.replace('. ', '.', regex=False))
+
+    # Split into day, month, year on a single separator (., /, -)
+    parts = cleaned.str.extract(DATE_RE)
+    # Day and month only lose their leading zeros (like int()) and are padded to 2 digits,
+    # years too large to parse become NaN and leave the date invalid
+    day = parts['day'].str.lstrip('0').str.zfill(2)
+    month = parts['month'].str.lstrip('0').str.zfill(2)
+    year = pd.to_numeric(parts['year'], errors='coerce')
+
+    # Handle 2-digit years (assume 1951-1999 above 50, otherwise 2000-2050)
+    two_digit = year.between(10, 99)
+    year = year.mask(two_digit, year + np.where(year > 50, 1900, 2000))
+    valid = year.between(1000, 9999)
+
+    # Invalid dates keep their cleaned form
+    out = s.copy()
+    out.loc[todo] = cleaned
+    out.loc[valid.index[valid]] = day[valid] + '.' + month[valid] + '.' + year[valid].astype(int).astype(str)
+    return out
 
-df['DatumRođenja'] = df['DatumRođenja'].apply(normalize_date)
+df['DatumRođenja'] = normalize_dates(df['DatumRođenja'])
 
-# save cleaned csv
-df.to_csv('data/cleaned_' + filename, index=False)
\ No newline at end of file
+# save cleaned csv (through a large write buffer to keep the number of writes low)
+with open(output_path, 'w', buffering=1 << 20, newline='', encoding='utf-8') as f:
+    df.to_csv(f, index=False, chunksize=100_000)